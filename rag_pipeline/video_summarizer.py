@@ -6,48 +6,249 @@ Automatically processes videos in any language and creates searchable summaries
 
 import os
 import json
-import cv2
-import numpy as np
-import google.generativeai as genai
+import math
+from pathlib import Path
 from datetime import datetime
-import base64
+import asyncio
+import hashlib
+import shutil
+import textwrap
 import time
 import warnings
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential_jitter, retry_if_exception
 warnings.filterwarnings("ignore")
 
+# Heavy imports (av, cv2, numpy, google.generativeai, JPEG encoders) are deferred to the
+# methods that use them so cache hits and view_summary start quickly
+
+# Rust JSON encoder for summary files, stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_jpeg_backend = None
+
+# Bump when the chunk prompt changes so cached chunk summaries are not reused
+PROMPT_VERSION = 2
+
+# JPEG encoders release the GIL, so frames encode in parallel across cores
+_ENC_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def get_jpeg_backend():
+    """Pick (once) the JPEG encoder: libjpeg-turbo via simplejpeg or PyTurboJPEG, else OpenCV"""
+    global _jpeg_backend
+    if _jpeg_backend is None:
+        try:
+            import simplejpeg
+            _jpeg_backend = ('simplejpeg', simplejpeg)
+        except ImportError:
+            try:
+                from turbojpeg import TurboJPEG
+                _jpeg_backend = ('turbojpeg', TurboJPEG())
+            except (ImportError, OSError, RuntimeError):
+                import cv2
+                _jpeg_backend = ('opencv', cv2)
+    return _jpeg_backend
+
+
+def frame_pixel_format():
+    """Decode frames straight into the channel order the active encoder takes, so no
+    colour conversion pass is needed before encoding (OpenCV expects BGR)"""
+    return 'bgr24' if get_jpeg_backend()[0] == 'opencv' else 'rgb24'
+
+
+def encode_jpeg(frame, quality=80):
+    """Encode a frame decoded as frame_pixel_format() to JPEG bytes"""
+    import numpy as np
+    backend, encoder = get_jpeg_backend()
+    frame = np.ascontiguousarray(frame)
+    
+    if backend == 'simplejpeg':
+        return encoder.encode_jpeg(frame, quality=quality, colorspace='RGB', fastdct=True)
+    
+    if backend == 'turbojpeg':
+        from turbojpeg import TJPF_RGB
+        return encoder.encode(frame, quality=quality, pixel_format=TJPF_RGB)
+    
+    # Baseline, non-optimized Huffman tables (fast path) with lighter chroma quality for smaller payloads
+    params = [
+        encoder.IMWRITE_JPEG_QUALITY, quality,
+        encoder.IMWRITE_JPEG_OPTIMIZE, 0,
+        encoder.IMWRITE_JPEG_PROGRESSIVE, 0,
+        encoder.IMWRITE_JPEG_LUMA_QUALITY, quality,
+        encoder.IMWRITE_JPEG_CHROMA_QUALITY, 70,
+    ]
+    _, buffer = encoder.imencode('.jpg', frame, params)
+    return buffer.tobytes()
+
+
+def split_mjpeg_stream(data):
+    """Split a concatenated MJPEG byte stream into individual JPEG images on their SOI markers"""
+    starts = []
+    pos = data.find(b'\xff\xd8\xff')
+    while pos != -1:
+        starts.append(pos)
+        pos = data.find(b'\xff\xd8\xff', pos + 3)
+    return [data[start:end] for start, end in zip(starts, starts[1:] + [len(data)])]
+
+
+def append_jsonl(f, record):
+    """Append one record to an open JSON-lines file and fsync it so it survives a crash"""
+    if orjson is not None:
+        line = orjson.dumps(record) + b'\n'
+    else:
+        line = json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+    f.write(line)
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def truncate_to_last_line(path, block_size=1 << 16):
+    """Drop a trailing partial line (e.g. torn by a crash) so appended records start on a fresh line"""
+    with open(path, 'rb+') as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            newline = f.read(step).rfind(b'\n')
+            if newline != -1:
+                f.truncate(pos + newline + 1)
+                return
+        f.truncate(0)
+
+
+def file_sha256(path, buf_size=1 << 20):
+    """SHA-256 hex digest of a file, read in 1 MiB blocks"""
+    h = hashlib.sha256()
+    with open(path, 'rb', buffering=0) as f:
+        for block in iter(lambda: f.read(buf_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+class TokenBucket:
+    """Async token bucket limiter: `rate` requests per second with bursts up to `burst`"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and consume it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
 class VideoSummarizer:
     def __init__(self):
         # Configure Gemini API
         self.api_key = os.getenv("GEMINI_API_KEY")
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-1.5-pro')
+        self._model = None  # created on first use, see the model property
         
         # Configuration
         self.chunk_duration = 30  # 30 seconds per chunk
         self.max_summary_chars = 1500
+        self.max_frame_edge = 768  # Gemini's vision encoder downsamples larger frames anyway
+        self.frame_extractor = "ffmpeg"  # "ffmpeg" (select filter straight to JPEG) or "pyav" (decode + encode)
+        
+        # Prompts are built once; only the per-chunk time range is added for each request
+        self._prompt_header = textwrap.dedent(f"""\
+            Analyze this {self.chunk_duration}-second video segment and provide a comprehensive summary in English.
+            
+            IMPORTANT: Your response must be EXACTLY {self.max_summary_chars} characters or less. Do not exceed this limit.
+            
+            Please provide:
+            1. Visual description: What is happening in the video? Include objects, people, actions, scenes, text
+            2. Audio analysis: Describe speech, music, sound effects, ambient sounds (provide general description, not word-for-word transcription)
+            3. Key events: Main activities or important moments
+            4. Context: Overall theme or topic
+            5. Audio-Visual correlation: How audio and visual elements relate
+            
+            Structure your response to fit within {self.max_summary_chars} characters. Be concise but comprehensive.
+            Focus on describing content rather than listing specific phrases or keywords.
+            End your response naturally - do not use ellipses or indicate truncation.
+            """)
+        self._batch_prompt_header = textwrap.dedent(f"""\
+            Analyze each of the following video segments (up to {self.chunk_duration} seconds each) independently and provide a comprehensive summary in English for each one.
+            Every segment starts with a line "=== CHUNK <number> (<time range>) ===" followed by its key frames and audio.
+            
+            IMPORTANT: Each summary must be EXACTLY {self.max_summary_chars} characters or less. Do not exceed this limit.
+            
+            For each segment please provide:
+            1. Visual description: What is happening in the video? Include objects, people, actions, scenes, text
+            2. Audio analysis: Describe speech, music, sound effects, ambient sounds (provide general description, not word-for-word transcription)
+            3. Key events: Main activities or important moments
+            4. Context: Overall theme or topic
+            5. Audio-Visual correlation: How audio and visual elements relate
+            
+            Be concise but comprehensive. Focus on describing content rather than listing specific phrases or keywords.
+            End each summary naturally - do not use ellipses or indicate truncation.
+            
+            Respond ONLY with a JSON array: [{{"chunk_number": <number>, "summary": "<summary>"}}, ...]
+            """)
+        
+        # Concurrency / rate limiting for Gemini calls
+        self.max_concurrent_requests = 5
+        self.requests_per_minute = 30
+        self.chunks_per_request = 8  # chunks batched into a single Gemini request
+        self.max_output_tokens = 8192  # gemini-1.5-pro output token limit
         
+        # Content-addressed summary cache
+        self.output_folder = "output"
+        self.hash_cache_folder = os.path.join(self.output_folder, "by-hash")
+        self._sha_cache = {}
+        
+    @property
+    def model(self):
+        """Gemini model, configured on first use so google.generativeai is only imported when needed"""
+        if self._model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=self.api_key)
+            self._model = genai.GenerativeModel('gemini-1.5-pro')
+        return self._model
+    
     def ingest_video(self, video_path):
         """Function 1: Ingest/upload video file"""
+        import av
         print(f"Ingesting video: {video_path}")
         
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
         try:
+            with av.open(video_path) as container:
+                stream = container.streams.video[0]
+                fps = float(stream.average_rate) if stream.average_rate else 0.0
+                if stream.duration is not None:
+                    duration = float(stream.duration * stream.time_base)
+                else:
+                    duration = container.duration / av.time_base
+                size = [stream.codec_context.width, stream.codec_context.height]
+                frame_count = stream.frames or int(duration * fps)
             
-            video = cv2.VideoCapture(video_path)
-            duration = video.get(cv2.CAP_PROP_FRAME_COUNT) / video.get(cv2.CAP_PROP_FPS)
-            fps = video.get(cv2.CAP_PROP_FPS)
-            size = [int(video.get(cv2.CAP_PROP_FRAME_WIDTH)), int(video.get(cv2.CAP_PROP_FRAME_HEIGHT))]
-            frame_count = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
             video_info = {
                 'path': video_path,
                 'duration': duration,
                 'frame_count': frame_count,
                 'fps': fps,
                 'size': size,
-                'filename': os.path.basename(video_path)
+                'filename': os.path.basename(video_path),
+                'source_sha256': self.get_video_sha256(video_path)
             }
             
             print(f"Video loaded successfully!")
@@ -55,22 +256,31 @@ class VideoSummarizer:
             print(f"FPS: {fps}")
             print(f"Size: {size}")
             
-            return video, video_info
+            return video_info
             
         except Exception as e:
             raise Exception(f"Error loading video: {str(e)}")
     
+    def get_video_sha256(self, video_path):
+        """SHA-256 of the video file, memoized per (path, mtime, size)"""
+        stat = os.stat(video_path)
+        key = (os.path.abspath(video_path), stat.st_mtime_ns, stat.st_size)
+        if key not in self._sha_cache:
+            self._sha_cache[key] = file_sha256(video_path)
+        return self._sha_cache[key]
+    
     def segment_video(self, video_info):
         """Function 2: Segment video into chunks"""
         print(f"Segmenting video into {self.chunk_duration}-second chunks...")
         
         chunks = []
         duration = video_info['duration']
-        chunk_count = int(np.ceil(duration / self.chunk_duration))
+        chunk_duration = self.chunk_duration
+        chunk_count = math.ceil(duration / chunk_duration)
         
         for i in range(chunk_count):
-            start_time = i * self.chunk_duration
-            end_time = min((i + 1) * self.chunk_duration, duration)
+            start_time = i * chunk_duration
+            end_time = min((i + 1) * chunk_duration, duration)
             chunk_info = {
                 'chunk_number': i + 1,
                 'start_time': start_time,
@@ -85,27 +295,58 @@ class VideoSummarizer:
         print(f"Created {len(chunks)} chunks")
         return chunks
     
-    def extract_frames_and_audio(self, video, chunk_info, video_path):
-        """Extract key frames and audio from a video chunk"""
-        start_time = chunk_info['start_time']
-        end_time = chunk_info['end_time']
-        fps = video.get(cv2.CAP_PROP_FPS)
-        
+    def get_frame_times(self, start_time, end_time):
+        """Timestamps of the key frames sampled from a chunk (start, middle, end)"""
         duration = end_time - start_time
         if duration > 0.1:
-            frame_times = [start_time, start_time + duration/2, end_time - 0.1]
-        else:
-            frame_times = [start_time]
+            return [start_time, start_time + duration/2, end_time - 0.1]
+        return [start_time]
+    
+    def decode_frame_at(self, container, stream, frame_time):
+        """Seek to the keyframe before `frame_time` and decode forward to the first frame at or after it"""
+        offset = stream.start_time or 0
+        target_pts = offset + int(frame_time / stream.time_base)
+        container.seek(target_pts, stream=stream)
         
-        frames = []
-        for frame_time in frame_times:
-            frame_number = int(frame_time * fps)
-            video.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            ret, frame = video.read()
-            if ret:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frames.append(frame)
+        frame = None
+        for frame in container.decode(stream):
+            if frame.pts is not None and frame.pts >= target_pts:
+                break
+        if frame is None:
+            return None
+        
+        pixel_format = frame_pixel_format()
         
+        # Downscale to max_frame_edge on the long side in the same libswscale pass as the colour conversion
+        scale = self.max_frame_edge / max(frame.width, frame.height)
+        if scale < 1:
+            frame = frame.reformat(
+                width=max(1, int(frame.width * scale)),
+                height=max(1, int(frame.height * scale)),
+                format=pixel_format,
+            )
+        return frame.to_ndarray(format=pixel_format)
+    
+    def extract_frames(self, video_path, start_time, end_time):
+        """Decode the key frames of one chunk, opening the video only for the duration of the call"""
+        import av
+        frames = []
+        with av.open(video_path) as container:
+            stream = container.streams.video[0]
+            stream.thread_type = 'AUTO'
+            
+            for frame_time in self.get_frame_times(start_time, end_time):
+                try:
+                    frame = self.decode_frame_at(container, stream, frame_time)
+                except Exception as e:
+                    print(f"Warning: Could not decode frame at {frame_time:.2f}s - {str(e)}")
+                    frame = None
+                if frame is not None:
+                    frames.append(frame)
+        return frames
+    
+    def extract_audio(self, chunk_info, video_path):
+        """Extract the audio track of a video chunk as WAV bytes"""
         # Extract audio using FFmpeg
         audio_data = None
         temp_audio_path = None
@@ -113,7 +354,7 @@ class VideoSummarizer:
         try:
             os.makedirs("temp_audio", exist_ok=True)
             timestamp = int(time.time() * 1000)
-            temp_audio_path = f"temp_audio/chunk_audio_{timestamp}.wav"
+            temp_audio_path = f"temp_audio/chunk_audio_{chunk_info['chunk_number']}_{timestamp}.wav"
             
             cmd = [
                 'ffmpeg',
@@ -137,62 +378,173 @@ class VideoSummarizer:
             audio_data = None
             temp_audio_path = None
         
-        return frames, audio_data, temp_audio_path
+        return audio_data, temp_audio_path
+    
+    def frame_select_filter(self, chunk_info):
+        """ffmpeg -vf filter picking a chunk's key frames and downscaling them, plus the number of frames it selects"""
+        start_time = chunk_info['start_time']
+        frame_times = [frame_time - start_time for frame_time in self.get_frame_times(start_time, chunk_info['end_time'])]
+        
+        # Select the first decoded frame at or after each target time (times are relative to -ss)
+        conditions = ['isnan(prev_selected_t)']
+        for frame_time in frame_times[1:]:
+            conditions.append(f"gte(t,{frame_time:.3f})*lt(prev_selected_t,{frame_time:.3f})")
+        edge = self.max_frame_edge
+        video_filter = (
+            f"select='{'+'.join(conditions)}',"
+            f"scale='if(gt(iw,ih),min({edge},iw),-2)':'if(gt(iw,ih),-2,min({edge},ih))'"
+        )
+        return video_filter, len(frame_times)
+    
+    async def extract_chunk_jpegs(self, video_path, chunk_info):
+        """Extract a chunk's key frames as resized JPEGs with one ffmpeg select-filter pass"""
+        video_filter, frame_count = self.frame_select_filter(chunk_info)
+        cmd = [
+            'ffmpeg', '-v', 'error',
+            '-ss', str(chunk_info['start_time']),
+            '-t', str(chunk_info['duration']),
+            '-i', video_path,
+            '-vf', video_filter,
+            '-vsync', '0',
+            '-frames:v', str(frame_count),
+            '-f', 'image2pipe', '-vcodec', 'mjpeg', '-q:v', '3',
+            '-'
+        ]
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"ffmpeg frame extraction failed: {stderr.decode(errors='replace').strip()}")
+        return split_mjpeg_stream(stdout)
+    
+    async def decode_chunk_jpegs(self, video_path, chunk_info):
+        """Decode a chunk's key frames with PyAV on a worker thread and encode them to JPEG"""
+        loop = asyncio.get_running_loop()
+        frames = await loop.run_in_executor(
+            None, self.extract_frames, video_path, chunk_info['start_time'], chunk_info['end_time']
+        )
+        return await self.frames_to_jpeg(frames)
     
-    def frames_to_base64(self, frames):
-        """Convert frames to base64 for API"""
-        base64_frames = []
-        for frame in frames:
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            _, buffer = cv2.imencode('.jpg', frame_bgr, [cv2.IMWRITE_JPEG_QUALITY, 80])
-            frame_b64 = base64.b64encode(buffer).decode('utf-8')
-            base64_frames.append(frame_b64)
+    async def frames_to_jpeg(self, frames):
+        """Encode frames as raw JPEG bytes for the API on the encoder thread pool"""
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(loop.run_in_executor(_ENC_POOL, encode_jpeg, frame) for frame in frames))
+    
+    def chunk_cache_path(self, jpeg_frames, audio_data):
+        """Cache file for a chunk, keyed by the sha256 of its frames, audio and prompt version"""
+        h = hashlib.sha256(f"prompt-v{PROMPT_VERSION}:{self.chunk_duration}:{self.max_summary_chars}".encode())
+        for jpeg_bytes in jpeg_frames:
+            h.update(jpeg_bytes)
+        if audio_data:
+            h.update(audio_data)
+        return os.path.join(self.hash_cache_folder, "chunks", f"{h.hexdigest()}.json")
+    
+    def load_cached_chunk_summary(self, cache_path):
+        """Return a cached chunk summary, or None on a cache miss"""
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)['summary']
+        except (json.JSONDecodeError, KeyError, OSError):
+            return None
+    
+    def save_cached_chunk_summary(self, cache_path, summary):
+        """Store a chunk summary in the content-addressed cache"""
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'prompt_version': PROMPT_VERSION, 'summary': summary}, f, ensure_ascii=False)
+    
+    async def generate_with_retry(self, content, generation_config, rate_limiter=None):
+        """Call Gemini asynchronously, retrying rate-limit (429) errors with exponential backoff"""
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(5),
+            wait=wait_exponential_jitter(initial=2, max=60),
+            retry=retry_if_exception(lambda e: "429" in str(e)),
+            reraise=True,
+        ):
+            with attempt:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                return await self.model.generate_content_async(content, generation_config=generation_config)
+    
+    async def prepare_chunk(self, chunk_info, video_path):
+        """Get a chunk's JPEG frames and audio, ready to be sent to Gemini.
+        
+        Frames are only extracted here, when the chunk is about to be sent: straight from ffmpeg
+        (extract_chunk_jpegs) or decoded with PyAV and encoded (decode_chunk_jpegs), depending on
+        frame_extractor. Audio is extracted concurrently on a worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        # Raw bytes are sent as protobuf blobs, no base64 needed
+        if self.frame_extractor == "ffmpeg":
+            jpeg_task = self.extract_chunk_jpegs(video_path, chunk_info)
+        else:
+            jpeg_task = self.decode_chunk_jpegs(video_path, chunk_info)
+        (audio_data, temp_audio_path), jpeg_frames = await asyncio.gather(
+            loop.run_in_executor(None, self.extract_audio, chunk_info, video_path),
+            jpeg_task,
+        )
+        
+        # Clean up temporary audio file (its bytes are already in memory)
+        if temp_audio_path and os.path.exists(temp_audio_path):
+            try:
+                os.remove(temp_audio_path)
+            except Exception as e:
+                print(f"Warning: Could not delete temp audio file {temp_audio_path}: {e}")
         
-        return base64_frames
+        return {
+            'chunk_info': chunk_info,
+            'jpeg_frames': jpeg_frames,
+            'audio_data': audio_data,
+            'cache_path': self.chunk_cache_path(jpeg_frames, audio_data)
+        }
+    
+    def chunk_media_parts(self, prepared):
+        """Image and audio parts of a prepared chunk for the Gemini request"""
+        parts = []
+        for jpeg_bytes in prepared['jpeg_frames']:
+            parts.append({
+                "mime_type": "image/jpeg",
+                "data": jpeg_bytes
+            })
+
+        if prepared['audio_data']:
+            parts.append({
+                "mime_type": "audio/wav",
+                "data": prepared['audio_data']
+            })
+        else:
+            print(f"No audio available for chunk {prepared['chunk_info']['chunk_number']}")
+        return parts
     
-    def summarize_chunk(self, video, chunk_info, video_path):
+    def truncate_summary(self, summary):
+        """Trim a summary to max_summary_chars, preferring a sentence boundary"""
+        if len(summary) > self.max_summary_chars:
+            # Find last complete sentence within limit
+            truncate_pos = summary.rfind('.', 0, self.max_summary_chars - 10)
+            if truncate_pos > self.max_summary_chars * 0.7:  # If we found a good sentence ending
+                summary = summary[:truncate_pos + 1]
+            else:
+                # Fallback to character limit with proper ending
+                summary = summary[:self.max_summary_chars - 3] + "..."
+        return summary
+    
+    async def summarize_chunk(self, prepared, rate_limiter=None):
         """Function 3: Summarize video chunk using Gemini"""
+        chunk_info = prepared['chunk_info']
         print(f"Summarizing chunk {chunk_info['chunk_number']}...")
         
         try:
-            frames, audio_data, temp_audio_path = self.extract_frames_and_audio(video, chunk_info, video_path)
-            prompt = f"""
-            Analyze this {self.chunk_duration}-second video segment and provide a comprehensive summary in English.
-            
-            Time range: {chunk_info['timestamp']}
-            Chunk duration: {chunk_info['duration']:.2f} seconds
-            
-            IMPORTANT: Your response must be EXACTLY {self.max_summary_chars} characters or less. Do not exceed this limit.
-            
-            Please provide:
-            1. Visual description: What is happening in the video? Include objects, people, actions, scenes, text
-            2. Audio analysis: Describe speech, music, sound effects, ambient sounds (provide general description, not word-for-word transcription)
-            3. Key events: Main activities or important moments
-            4. Context: Overall theme or topic
-            5. Audio-Visual correlation: How audio and visual elements relate
-            
-            Structure your response to fit within {self.max_summary_chars} characters. Be concise but comprehensive.
-            Focus on describing content rather than listing specific phrases or keywords.
-            End your response naturally - do not use ellipses or indicate truncation.
-            """
+            prompt = (
+                f"{self._prompt_header}\n"
+                f"Time range: {chunk_info['timestamp']}\n"
+                f"Chunk duration: {chunk_info['duration']:.2f} seconds"
+            )
             
             # Prepare content for Gemini API
-            base64_frames = self.frames_to_base64(frames)
-            content = [prompt]
-            for frame_b64 in base64_frames:
-                content.append({
-                    "mime_type": "image/jpeg",
-                    "data": frame_b64
-                })
-
-            if audio_data:
-                audio_b64 = base64.b64encode(audio_data).decode('utf-8')
-                content.append({
-                    "mime_type": "audio/wav",
-                    "data": audio_b64
-                })
-            else:
-                print(f"No audio available for this chunk")
+            content = [prompt] + self.chunk_media_parts(prepared)
             
             # Configure generation with stricter parameters
             generation_config = {
@@ -200,27 +552,11 @@ class VideoSummarizer:
                 "temperature": 0.3,  # Lower temperature for more focused output
             }
             
-            response = self.model.generate_content(content, generation_config=generation_config)
-            summary = response.text.strip()
-            
-            # Only truncate if still too long (as backup)
-            if len(summary) > self.max_summary_chars:
-                # Find last complete sentence within limit
-                truncate_pos = summary.rfind('.', 0, self.max_summary_chars - 10)
-                if truncate_pos > self.max_summary_chars * 0.7:  # If we found a good sentence ending
-                    summary = summary[:truncate_pos + 1]
-                else:
-                    # Fallback to character limit with proper ending
-                    summary = summary[:self.max_summary_chars - 3] + "..."
+            response = await self.generate_with_retry(content, generation_config, rate_limiter)
+            summary = self.truncate_summary(response.text.strip())
             
             print(f"Summary generated ({len(summary)} characters)")
-            
-            # Clean up temporary audio file
-            if temp_audio_path and os.path.exists(temp_audio_path):
-                try:
-                    os.remove(temp_audio_path)
-                except Exception as e:
-                    print(f"Warning: Could not delete temp audio file {temp_audio_path}: {e}")
+            self.save_cached_chunk_summary(prepared['cache_path'], summary)
             
             return summary
             
@@ -228,6 +564,130 @@ class VideoSummarizer:
             print(f"Error summarizing chunk {chunk_info['chunk_number']}: {str(e)}")
             return f"Error processing chunk: {str(e)}"
     
+    async def summarize_chunk_batch(self, batch, rate_limiter=None):
+        """Summarize several prepared chunks in a single Gemini request.
+        
+        Returns a list of summaries aligned with `batch`. Chunks the model leaves out of its
+        JSON answer (or the whole batch, if the answer cannot be parsed) are retried one by one.
+        If the request itself fails (after generate_with_retry's retries), every chunk is recorded
+        as an error for resume_failed_processing instead, so a rate limit is not multiplied.
+        """
+        if len(batch) == 1:
+            return [await self.summarize_chunk(batch[0], rate_limiter)]
+        
+        chunk_numbers = [prepared['chunk_info']['chunk_number'] for prepared in batch]
+        print(f"Summarizing chunks {chunk_numbers} in one request...")
+        
+        summaries = {}
+        try:
+            content = [self._batch_prompt_header]
+            for prepared in batch:
+                chunk_info = prepared['chunk_info']
+                content.append(
+                    f"=== CHUNK {chunk_info['chunk_number']} ({chunk_info['timestamp']}) ===\n"
+                    f"Chunk duration: {chunk_info['duration']:.2f} seconds"
+                )
+                content.extend(self.chunk_media_parts(prepared))
+            
+            # ~1 token per 3 characters covers one summary plus its JSON wrapping; never exceed the model limit
+            tokens_per_chunk = self.max_summary_chars // 3
+            generation_config = {
+                "max_output_tokens": min(tokens_per_chunk * len(batch), self.max_output_tokens),
+                "temperature": 0.3,
+                "response_mime_type": "application/json",
+            }
+            
+            response = await self.generate_with_retry(content, generation_config, rate_limiter)
+            
+        except Exception as e:
+            print(f"Error summarizing batch {chunk_numbers}: {str(e)}")
+            return [f"Error processing chunk: {str(e)}"] * len(batch)
+        
+        try:
+            for item in json.loads(response.text):
+                summaries[int(item['chunk_number'])] = self.truncate_summary(str(item['summary']).strip())
+        except (ValueError, TypeError, KeyError) as e:
+            print(f"Could not parse batch response for chunks {chunk_numbers}: {str(e)}")
+        
+        results = []
+        for prepared in batch:
+            chunk_number = prepared['chunk_info']['chunk_number']
+            summary = summaries.get(chunk_number)
+            if summary:
+                print(f"Summary generated for chunk {chunk_number} ({len(summary)} characters)")
+                self.save_cached_chunk_summary(prepared['cache_path'], summary)
+            else:
+                summary = await self.summarize_chunk(prepared, rate_limiter)
+            results.append(summary)
+        return results
+    
+    async def summarize_chunks(self, video_path, chunks, on_summary=None, use_cache=True):
+        """Summarize chunks concurrently in batches of chunks_per_request, bounded by a semaphore and a token-bucket rate limiter.
+        
+        on_summary(chunk_info, summary), if given, is called as soon as each chunk's summary is available.
+        With use_cache=False the per-chunk cache is not read (fresh summaries still overwrite it).
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        rate_limiter = TokenBucket(rate=self.requests_per_minute / 60, burst=self.max_concurrent_requests)
+        summaries = {}
+        
+        def record(chunk_info, summary):
+            summaries[chunk_info['chunk_number']] = summary
+            if on_summary is not None:
+                on_summary(chunk_info, summary)
+        
+        async def bounded(batch):
+            try:
+                results = await self.summarize_chunk_batch(batch, rate_limiter)
+                for prepared, summary in zip(batch, results):
+                    record(prepared['chunk_info'], summary)
+            finally:
+                semaphore.release()
+        
+        # Extract chunks_per_request chunks at a time concurrently (one ffmpeg process each), and
+        # acquire before extracting more so only in-flight batches hold frames in memory
+        tasks = []
+        batch = []
+        for group_start in range(0, len(chunks), self.chunks_per_request):
+            group = chunks[group_start:group_start + self.chunks_per_request]
+            prepared_group = await asyncio.gather(
+                *(self.prepare_chunk(chunk_info, video_path) for chunk_info in group),
+                return_exceptions=True,
+            )
+            
+            for chunk_info, prepared in zip(group, prepared_group):
+                if isinstance(prepared, Exception):
+                    print(f"Error preparing chunk {chunk_info['chunk_number']}: {str(prepared)}")
+                    record(chunk_info, f"Error processing chunk: {str(prepared)}")
+                    continue
+                
+                # Identical frames + audio were already summarized (e.g. a resumed or duplicated clip)
+                cached_summary = self.load_cached_chunk_summary(prepared['cache_path']) if use_cache else None
+                if cached_summary is not None:
+                    print(f"Using cached summary for chunk {chunk_info['chunk_number']}")
+                    record(chunk_info, cached_summary)
+                    continue
+                
+                batch.append(prepared)
+                if len(batch) >= self.chunks_per_request:
+                    await semaphore.acquire()
+                    tasks.append(asyncio.create_task(bounded(batch)))
+                    batch = []
+        
+        if batch:
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(bounded(batch)))
+        
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                print(f"Error summarizing batch: {str(result)}")
+        
+        chunk_summaries = []
+        for chunk_info in chunks:
+            summary = summaries.get(chunk_info['chunk_number'], "Error processing chunk: no summary returned")
+            chunk_summaries.append((chunk_info, summary))
+        return chunk_summaries
+    
     def cleanup_temp_files(self):
         """Clean up any remaining temporary audio files"""
         temp_dir = "temp_audio"
@@ -250,55 +710,157 @@ class VideoSummarizer:
             'total_duration': video_info['duration'],
             'fps': video_info['fps'],
             'size': video_info['size'],
+            'source_sha256': video_info.get('source_sha256'),
             'processing_date': datetime.now().isoformat(),
             'total_chunks': len(chunk_summaries),
             'chunk_duration': self.chunk_duration,
+            'frame_max_edge': self.max_frame_edge,
             'chunks': []
         }
         
         for chunk_info, summary in chunk_summaries:
-            chunk_data = {
-                'chunk_number': chunk_info['chunk_number'],
-                'timestamp': chunk_info['timestamp'],
-                'start_time': chunk_info['start_time'],
-                'end_time': chunk_info['end_time'],
-                'duration': chunk_info['duration'],
-                'summary': summary,
-                'summary_length': len(summary)
-            }
-            video_summary['chunks'].append(chunk_data)
+            video_summary['chunks'].append(self.create_chunk_data(chunk_info, summary))
         
         return video_summary
     
+    def create_chunk_data(self, chunk_info, summary):
+        """JSON entry for one summarized chunk"""
+        return {
+            'chunk_number': chunk_info['chunk_number'],
+            'timestamp': chunk_info['timestamp'],
+            'start_time': chunk_info['start_time'],
+            'end_time': chunk_info['end_time'],
+            'duration': chunk_info['duration'],
+            'summary': summary,
+            'summary_length': len(summary)
+        }
+    
+    def partial_summary_path(self, video_filename):
+        """JSON-lines sidecar that chunk summaries are streamed to while a video is processed"""
+        video_name = os.path.splitext(video_filename)[0]
+        return os.path.join(self.output_folder, f"{video_name}_summary.jsonl.part")
+    
+    def load_partial_summary(self, partial_path, video_info=None):
+        """Read a JSON-lines sidecar back into (header, {chunk_number: chunk_data}).
+        
+        Later lines win, and a line truncated by a crash is skipped. If video_info is given and the
+        sidecar belongs to a different file or chunking, (None, {}) is returned.
+        """
+        if not os.path.exists(partial_path):
+            return None, {}
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        header = None
+        chunks = {}
+        with open(partial_path, 'rb') as f:
+            for line in f:
+                try:
+                    record = loads(line)
+                except ValueError:
+                    continue
+                if record.get('type') == 'video':
+                    header = record
+                elif record.get('type') == 'chunk':
+                    chunks[record['chunk']['chunk_number']] = record['chunk']
+        
+        if header is None:
+            return None, {}
+        if video_info is not None and (
+            header['video_info'].get('source_sha256') != video_info.get('source_sha256')
+            or header['chunk_duration'] != self.chunk_duration
+        ):
+            return None, {}
+        return header, chunks
+    
     def save_summary_json(self, video_summary, output_path=None):
         """Save the video summary to JSON file"""
         # Ensure output folder exists
-        output_folder = "output"
-        os.makedirs(output_folder, exist_ok=True)
+        os.makedirs(self.output_folder, exist_ok=True)
         
         if output_path is None:
             video_name = os.path.splitext(video_summary['video_name'])[0]
-            output_path = os.path.join(output_folder, f"{video_name}_summary.json")
+            output_path = os.path.join(self.output_folder, f"{video_name}_summary.json")
+            
+            # Store under the content hash and point the named file at it
+            source_sha = video_summary.get('source_sha256')
+            if source_sha:
+                os.makedirs(self.hash_cache_folder, exist_ok=True)
+                hash_path = self.hash_summary_path(source_sha, video_summary['video_name'])
+                self.write_json(video_summary, hash_path)
+                self.link_summary(hash_path, output_path)
+                print(f"Summary saved to: {output_path}")
+                return output_path
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(video_summary, f, indent=2, ensure_ascii=False)
+        self.write_json(video_summary, output_path)
         
         print(f"Summary saved to: {output_path}")
         return output_path
     
+    def hash_summary_path(self, source_sha, video_name):
+        """by-hash file for a summary: <sha>.json, or <sha>.<name>.json for a renamed copy of a video already stored there"""
+        hash_path = os.path.join(self.hash_cache_folder, f"{source_sha}.json")
+        try:
+            with open(hash_path, 'r', encoding='utf-8') as f:
+                stored_name = json.load(f).get('video_name')
+        except (json.JSONDecodeError, OSError):
+            return hash_path
+        if stored_name in (None, video_name):
+            return hash_path
+        return os.path.join(self.hash_cache_folder, f"{source_sha}.{os.path.splitext(video_name)[0]}.json")
+    
+    def write_json(self, data, path):
+        """Write data as pretty-printed UTF-8 JSON"""
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    
+    def link_summary(self, target_path, link_path):
+        """Symlink link_path to target_path, copying instead where symlinks are unsupported"""
+        if os.path.lexists(link_path):
+            os.remove(link_path)
+        try:
+            os.symlink(os.path.relpath(target_path, os.path.dirname(link_path)), link_path)
+        except OSError:
+            shutil.copyfile(target_path, link_path)
+    
     def check_existing_summary(self, video_path):
         """Check if a summary already exists for this video"""
-        video_filename = os.path.basename(video_path)
-        video_name = os.path.splitext(video_filename)[0]
-        summary_filename = f"{video_name}_summary.json"
+        video_path = Path(video_path)
+        summary_filename = f"{video_path.stem}_summary.json"
         
-        if os.path.exists(summary_filename):
-            try:
-                with open(summary_filename, 'r', encoding='utf-8') as f:
-                    existing_summary = json.load(f)
-                return existing_summary, summary_filename
-            except (json.JSONDecodeError, FileNotFoundError):
-                return None, None
+        # Content-addressed lookup first so renamed copies of a video still hit,
+        # then the output/ file save_summary_json writes, then the legacy CWD location
+        candidates = []
+        hash_path = None
+        if video_path.exists():
+            video_sha = self.get_video_sha256(video_path)
+            hash_path = Path(self.hash_cache_folder) / f"{video_sha}.json"
+            candidates.append(hash_path)
+        candidates.append(Path(self.output_folder) / summary_filename)
+        candidates.append(Path(summary_filename))
+        
+        for candidate in candidates:
+            if candidate.exists():
+                try:
+                    with candidate.open('r', encoding='utf-8') as f:
+                        existing_summary = json.load(f)
+                except (json.JSONDecodeError, FileNotFoundError):
+                    continue
+                if candidate == hash_path and existing_summary.get('video_name') != video_path.name:
+                    # Same content under another name: reuse the summary, but with this file's name and path
+                    renamed_path = self.hash_summary_path(video_sha, video_path.name)
+                    if os.path.exists(renamed_path):
+                        existing_summary = self.load_existing_summary(renamed_path) or existing_summary
+                    else:
+                        existing_summary = dict(existing_summary, video_name=video_path.name, video_path=str(video_path))
+                        self.write_json(existing_summary, renamed_path)
+                    candidate = Path(self.output_folder) / summary_filename
+                    self.link_summary(renamed_path, str(candidate))
+                return existing_summary, str(candidate)
         
         return None, None
     
@@ -321,6 +883,7 @@ class VideoSummarizer:
             # Load existing summary
             with open(existing_summary_path, 'r', encoding='utf-8') as f:
                 existing_summary = json.load(f)
+            chunk_index = {chunk['chunk_number']: i for i, chunk in enumerate(existing_summary['chunks'])}
             
             # Check which chunks failed
             failed_chunks = []
@@ -335,54 +898,41 @@ class VideoSummarizer:
             print(f"Found {len(failed_chunks)} failed chunks: {failed_chunks}")
             print("Re-processing failed chunks...")
             
-            # Re-process the video
-            video, video_info = self.ingest_video(video_path)
-            chunks = self.segment_video(video_info)
+            if not os.path.exists(video_path):
+                raise FileNotFoundError(f"Video file not found: {video_path}")
             
-            # Only re-process failed chunks
-            for chunk, chunk_info in chunks:
-                if chunk_info['chunk_number'] in failed_chunks:
-                    print(f"Re-processing chunk {chunk_info['chunk_number']}...")
-                    
-                    # Add longer delay for rate limit recovery
-                    time.sleep(3)
-                    
-                    try:
-                        summary = self.summarize_chunk(video, chunk_info, video_path)
-                        
-                        # Update the existing summary
-                        for i, existing_chunk in enumerate(existing_summary['chunks']):
-                            if existing_chunk['chunk_number'] == chunk_info['chunk_number']:
-                                existing_summary['chunks'][i]['summary'] = summary
-                                existing_summary['chunks'][i]['summary_length'] = len(summary)
-                                break
-                        
-                        print(f"Successfully re-processed chunk {chunk_info['chunk_number']}")
-                        
-                    except Exception as e:
-                        print(f"Still failing on chunk {chunk_info['chunk_number']}: {str(e)}")
-                        if "429" in str(e):
-                            print("Rate limit hit again. Waiting 60 seconds...")
-                            time.sleep(60)
-                            try:
-                                summary = self.summarize_chunk(chunk, chunk_info, video_path)
-                                for i, existing_chunk in enumerate(existing_summary['chunks']):
-                                    if existing_chunk['chunk_number'] == chunk_info['chunk_number']:
-                                        existing_summary['chunks'][i]['summary'] = summary
-                                        existing_summary['chunks'][i]['summary_length'] = len(summary)
-                                        break
-                                print(f"Successfully re-processed chunk {chunk_info['chunk_number']} after retry")
-                            except Exception as retry_error:
-                                print(f"Final failure on chunk {chunk_info['chunk_number']}: {str(retry_error)}")
+            # Only re-process failed chunks, seeking straight to their stored time ranges
+            chunk_keys = ('chunk_number', 'start_time', 'end_time', 'duration', 'timestamp')
+            retry_chunks = [
+                {key: chunk[key] for key in chunk_keys}
+                for chunk in existing_summary['chunks']
+                if chunk['chunk_number'] in failed_chunks
+            ]
+            try:
+                retried = asyncio.run(self.summarize_chunks(video_path, retry_chunks))
+            finally:
+                # The async client's grpc channel is bound to the loop asyncio.run just closed
+                self._model = None
+            for chunk_info, summary in retried:
+                # Update the existing summary
+                i = chunk_index[chunk_info['chunk_number']]
+                existing_summary['chunks'][i]['summary'] = summary
+                existing_summary['chunks'][i]['summary_length'] = len(summary)
+                
+                if 'Error processing chunk' in summary:
+                    print(f"Still failing on chunk {chunk_info['chunk_number']}")
+                else:
+                    print(f"Successfully re-processed chunk {chunk_info['chunk_number']}")
             
             # Update metadata
             existing_summary['processing_date'] = datetime.now().isoformat()
             
-            # Save updated summary
-            output_file = self.save_summary_json(existing_summary, existing_summary_path)
-            
-            # Clean up
-            video.release()
+            # Save updated summary; content-hashed summaries go through the by-hash file so the
+            # named output/<name>_summary.json (a symlink or, where unsupported, a copy) is refreshed too
+            if existing_summary.get('source_sha256'):
+                output_file = self.save_summary_json(existing_summary)
+            else:
+                output_file = self.save_summary_json(existing_summary, existing_summary_path)
             
             print("=" * 50)
             print("RESUME PROCESSING COMPLETED!")
@@ -401,6 +951,9 @@ class VideoSummarizer:
         print("VIDEO SUMMARIZATION STARTING")
         print("=" * 50)
         
+        # Cached chunk summaries and an interrupted run's sidecar are reused unless re-processing was asked for
+        use_cache = not force_reprocess
+        
         # Check if summary already exists
         if not force_reprocess:
             existing_summary, existing_path = self.check_existing_summary(video_path)
@@ -423,6 +976,7 @@ class VideoSummarizer:
                         return self.resume_failed_processing(video_path, existing_path)
                     else:
                         print("Full re-processing selected...")
+                        use_cache = False
                 else:
                     print("🔍 FOUND EXISTING SUMMARY!")
                     print(f"Summary file: {existing_path}")
@@ -442,51 +996,58 @@ class VideoSummarizer:
                         return existing_summary, existing_path
                     
                     print("Re-processing video as requested...")
+                    use_cache = False
         
         try:
             # Step 1: Ingest video
-            video, video_info = self.ingest_video(video_path)
+            video_info = self.ingest_video(video_path)
             
             # Step 2: Segment video
             chunks = self.segment_video(video_info)
             
-            # Step 3: Summarize each chunk with rate limiting
-            chunk_summaries = []
-            for i, chunk_info in enumerate(chunks):
-                try:
-                    summary = self.summarize_chunk(video, chunk_info, video_path)
-                    chunk_summaries.append((chunk_info, summary))
-                    
-                    # Progressive delay to avoid rate limits
-                    if i < 10:
-                        time.sleep(2)  # 2 seconds for first 10 chunks
-                    elif i < 20:
-                        time.sleep(4)  # 4 seconds for next 10 chunks
-                    else:
-                        time.sleep(6)  # 6 seconds for remaining chunks
+            # Step 3: Summarize chunks concurrently with rate limiting, streaming each
+            # finished chunk to a JSON-lines sidecar so progress survives a crash
+            os.makedirs(self.output_folder, exist_ok=True)
+            partial_path = self.partial_summary_path(video_info['filename'])
+            header, completed = self.load_partial_summary(partial_path, video_info) if use_cache else (None, {})
+            completed = {
+                chunk_number: chunk_data for chunk_number, chunk_data in completed.items()
+                if 'Error processing chunk' not in chunk_data['summary']
+            }
+            if completed:
+                print(f"Resuming interrupted run: {len(completed)} chunks already summarized in {partial_path}")
+            pending_chunks = [chunk_info for chunk_info in chunks if chunk_info['chunk_number'] not in completed]
+            
+            if header:
+                # A crash can leave a half-written last line; appending onto it would corrupt the next record
+                truncate_to_last_line(partial_path)
+            with open(partial_path, 'ab' if header else 'wb') as partial_file:
+                if not header:
+                    append_jsonl(partial_file, {'type': 'video', 'video_info': video_info, 'chunk_duration': self.chunk_duration})
                 
-                except Exception as e:
-                    if "429" in str(e):
-                        print(f"⏸️  Rate limit hit on chunk {chunk_info['chunk_number']}. Waiting 60 seconds...")
-                        time.sleep(60)
-                        try:
-                            summary = self.summarize_chunk(video, chunk_info, video_path)
-                            chunk_summaries.append((chunk_info, summary))
-                        except Exception as retry_error:
-                            error_summary = f"Error processing chunk: {str(retry_error)}"
-                            chunk_summaries.append((chunk_info, error_summary))
-                    else:
-                        error_summary = f"Error processing chunk: {str(e)}"
-                        chunk_summaries.append((chunk_info, error_summary))
+                def on_summary(chunk_info, summary):
+                    append_jsonl(partial_file, {'type': 'chunk', 'chunk': self.create_chunk_data(chunk_info, summary)})
+                
+                try:
+                    asyncio.run(self.summarize_chunks(video_path, pending_chunks, on_summary, use_cache=use_cache))
+                finally:
+                    # The async client's grpc channel is bound to the loop asyncio.run just closed
+                    self._model = None
             
-            # Step 4: Create JSON summary
+            # Step 4: Create JSON summary from the sidecar
+            _, chunk_records = self.load_partial_summary(partial_path)
+            chunk_summaries = []
+            for chunk_info in chunks:
+                chunk_data = chunk_records.get(chunk_info['chunk_number'])
+                summary = chunk_data['summary'] if chunk_data else "Error processing chunk: no summary returned"
+                chunk_summaries.append((chunk_info, summary))
             video_summary = self.create_video_summary_json(video_info, chunk_summaries)
             
             # Save to file
             output_file = self.save_summary_json(video_summary, output_path)
+            os.remove(partial_path)
             
             # Clean up
-            video.release()
             self.cleanup_temp_files()
             
             print("=" * 50)
@@ -505,9 +1066,16 @@ class VideoSummarizer:
         """View video summary in a readable format"""
         # Auto-detect summary file if not provided
         if json_file is None:
-            json_files = [f for f in os.listdir('.') if f.endswith('_summary.json')]
+            # output/ is where summaries are saved now; the current directory holds legacy ones
+            json_files = []
+            for folder in (self.output_folder, '.'):
+                if os.path.isdir(folder):
+                    json_files.extend(
+                        os.path.normpath(os.path.join(folder, f)) for f in sorted(os.listdir(folder))
+                        if f.endswith(('_summary.json', '_summary.jsonl.part'))
+                    )
             if not json_files:
-                print("No summary files found in current directory")
+                print(f"No summary files found in {self.output_folder}/ or current directory")
                 return
             elif len(json_files) == 1:
                 json_file = json_files[0]
@@ -522,9 +1090,15 @@ class VideoSummarizer:
                     print("Invalid selection")
                     return
         
+        # An in-progress JSON-lines sidecar is streamed chunk by chunk
+        if json_file.endswith('.jsonl.part'):
+            self.view_partial_summary(json_file)
+            return
+        
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                summary = json.load(f)
+            with open(json_file, 'rb') as f:
+                data = f.read()
+            summary = orjson.loads(data) if orjson is not None else json.loads(data)
             
             print("=" * 60)
             print("VIDEO SUMMARY REPORT")
@@ -544,15 +1118,7 @@ class VideoSummarizer:
             print("-" * 60)
             
             for chunk in summary['chunks']:
-                print(f"\nChunk {chunk['chunk_number']} ({chunk['timestamp']})")
-                print(f"📝 Summary ({chunk['summary_length']} chars):")
-                
-                summary_text = chunk['summary'].replace('\n\n', '\n').strip()
-                if len(summary_text) > 300:
-                    summary_text = summary_text[:300] + "..."
-                
-                print(f"   {summary_text}")
-                print("-" * 40)
+                self.print_chunk_summary(chunk)
             
             print("\n" + "=" * 60)
             
@@ -560,5 +1126,51 @@ class VideoSummarizer:
             print(f"File not found: {json_file}")
         except json.JSONDecodeError:
             print(f"Invalid JSON file: {json_file}")
+        except Exception as e:
+            print(f"Error reading file: {e}")
+    
+    def print_chunk_summary(self, chunk):
+        """Print one chunk entry, truncating long summaries"""
+        print(f"\nChunk {chunk['chunk_number']} ({chunk['timestamp']})")
+        print(f"📝 Summary ({chunk['summary_length']} chars):")
+        
+        summary_text = chunk['summary'].replace('\n\n', '\n').strip()
+        if len(summary_text) > 300:
+            summary_text = summary_text[:300] + "..."
+        
+        print(f"   {summary_text}")
+        print("-" * 40)
+    
+    def view_partial_summary(self, partial_file):
+        """View an in-progress JSON-lines summary, printing each chunk as it is read"""
+        loads = orjson.loads if orjson is not None else json.loads
+        try:
+            with open(partial_file, 'rb') as f:
+                print("=" * 60)
+                print("VIDEO SUMMARY REPORT (IN PROGRESS)")
+                print("=" * 60)
+                
+                for line in f:
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        continue
+                    
+                    if record.get('type') == 'video':
+                        video_info = record['video_info']
+                        print(f"Video: {video_info['filename']}")
+                        print(f"Duration: {video_info['duration']:.1f} seconds ({video_info['duration']//60:.0f}m {video_info['duration']%60:.0f}s)")
+                        print(f"Resolution: {video_info['size'][0]}x{video_info['size'][1]}")
+                        print(f"FPS: {video_info['fps']}")
+                        print()
+                        print("📝 CHUNK-BY-CHUNK SUMMARIES (completion order):")
+                        print("-" * 60)
+                    elif record.get('type') == 'chunk':
+                        self.print_chunk_summary(record['chunk'])
+                
+                print("\n" + "=" * 60)
+                
+        except FileNotFoundError:
+            print(f"File not found: {partial_file}")
         except Exception as e:
             print(f"Error reading file: {e}")
\ No newline at end of file
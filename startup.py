@@ -1,3 +1,4 @@
+import importlib.util
 import sys
 import subprocess
 import os
@@ -5,15 +6,16 @@ import os
 def setup_environment():
     """Setup environment before any other imports"""
     
-    # Install pysqlite3-binary
-    try:
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", 
-            "pysqlite3-binary", "--quiet", "--disable-pip-version-check"
-        ])
-        print("✓ pysqlite3-binary installed")
-    except Exception as e:
-        print(f"Warning: Could not install pysqlite3-binary: {e}")
+    # Install pysqlite3-binary only if it is missing (it is listed in requirements.txt)
+    if importlib.util.find_spec("pysqlite3") is None:
+        try:
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install", 
+                "pysqlite3-binary", "--quiet", "--disable-pip-version-check"
+            ])
+            print("✓ pysqlite3-binary installed")
+        except Exception as e:
+            print(f"Warning: Could not install pysqlite3-binary: {e}")
     
     # Replace sqlite3 module BEFORE any other imports
     try:
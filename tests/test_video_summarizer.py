@@ -0,0 +1,321 @@
+import asyncio
+import json
+import sys
+import types
+
+from tenacity import wait_none
+
+from rag_pipeline import video_summarizer
+from rag_pipeline.video_summarizer import VideoSummarizer, append_jsonl, split_mjpeg_stream, truncate_to_last_line
+
+
+def make_summarizer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "clip.mp4").write_bytes(b"not really a video" * 100)
+
+    summarizer = VideoSummarizer()
+    video_info = {
+        'path': "clip.mp4",
+        'duration': 75.0,
+        'frame_count': 1875,
+        'fps': 25.0,
+        'size': [1280, 720],
+        'filename': "clip.mp4",
+        'source_sha256': summarizer.get_video_sha256("clip.mp4"),
+    }
+    monkeypatch.setattr(summarizer, "ingest_video", lambda video_path: video_info)
+    return summarizer, video_info
+
+
+def fake_prepared_chunk(summarizer, chunk_info):
+    jpeg_frames = [f"frame {chunk_info['chunk_number']}".encode()]
+    return {
+        'chunk_info': chunk_info,
+        'jpeg_frames': jpeg_frames,
+        'audio_data': None,
+        'cache_path': summarizer.chunk_cache_path(jpeg_frames, None),
+    }
+
+
+def stub_prepare_chunk(summarizer, monkeypatch):
+    async def fake_prepare_chunk(chunk_info, video_path):
+        return fake_prepared_chunk(summarizer, chunk_info)
+
+    monkeypatch.setattr(summarizer, "prepare_chunk", fake_prepare_chunk)
+
+
+class FakeModel:
+    """Stands in for GenerativeModel: returns canned .text answers (or raises them) in order"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    async def generate_content_async(self, content, generation_config=None):
+        self.calls.append((content, generation_config))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return types.SimpleNamespace(text=response)
+
+
+def make_batch(tmp_path, monkeypatch, *responses):
+    summarizer, video_info = make_summarizer(tmp_path, monkeypatch)
+    summarizer._model = FakeModel(*responses)
+    batch = [fake_prepared_chunk(summarizer, chunk_info) for chunk_info in summarizer.segment_video(video_info)]
+    return summarizer, batch
+
+
+def test_truncate_to_last_line_drops_torn_tail(tmp_path):
+    path = tmp_path / "partial.jsonl.part"
+    path.write_bytes(b'{"a": 1}\n{"b": 2}\n{"c": ')
+    truncate_to_last_line(path, block_size=4)
+    assert path.read_bytes() == b'{"a": 1}\n{"b": 2}\n'
+
+    truncate_to_last_line(path)
+    assert path.read_bytes() == b'{"a": 1}\n{"b": 2}\n'
+
+    path.write_bytes(b'{"torn')
+    truncate_to_last_line(path)
+    assert path.read_bytes() == b''
+
+
+def test_resume_after_torn_sidecar_line_keeps_new_summaries(tmp_path, monkeypatch):
+    summarizer, video_info = make_summarizer(tmp_path, monkeypatch)
+    chunks = summarizer.segment_video(video_info)
+
+    # Sidecar left behind by a crash: header, one finished chunk, then a half-written record
+    (tmp_path / "output").mkdir()
+    partial_path = summarizer.partial_summary_path("clip.mp4")
+    with open(partial_path, 'wb') as f:
+        append_jsonl(f, {'type': 'video', 'video_info': video_info, 'chunk_duration': summarizer.chunk_duration})
+        append_jsonl(f, {'type': 'chunk', 'chunk': summarizer.create_chunk_data(chunks[0], "done before crash")})
+        f.write(b'{"type": "chunk", "chunk": {"chunk_number": 2, "summ')
+
+    summarized = []
+
+    async def fake_summarize_chunks(video_path, pending_chunks, on_summary=None, use_cache=True):
+        for chunk_info in pending_chunks:
+            summarized.append(chunk_info['chunk_number'])
+            on_summary(chunk_info, f"resumed {chunk_info['chunk_number']}")
+        return []
+
+    monkeypatch.setattr(summarizer, "summarize_chunks", fake_summarize_chunks)
+
+    video_summary, output_file = summarizer.process_video("clip.mp4")
+
+    assert summarized == [2, 3]
+    assert [chunk['summary'] for chunk in video_summary['chunks']] == ["done before crash", "resumed 2", "resumed 3"]
+    with open(output_file, 'r', encoding='utf-8') as f:
+        assert [chunk['summary'] for chunk in json.load(f)['chunks']] == ["done before crash", "resumed 2", "resumed 3"]
+    assert not (tmp_path / partial_path).exists()
+
+
+def test_reprocess_skips_chunk_cache(tmp_path, monkeypatch):
+    summarizer, video_info = make_summarizer(tmp_path, monkeypatch)
+    use_cache_flags = []
+
+    async def fake_summarize_chunks(video_path, pending_chunks, on_summary=None, use_cache=True):
+        use_cache_flags.append(use_cache)
+        for chunk_info in pending_chunks:
+            on_summary(chunk_info, "fresh")
+        return []
+
+    monkeypatch.setattr(summarizer, "summarize_chunks", fake_summarize_chunks)
+
+    summarizer.process_video("clip.mp4")
+    summarizer.process_video("clip.mp4", force_reprocess=True)
+    monkeypatch.setattr("builtins.input", lambda prompt: "n")
+    summarizer.process_video("clip.mp4")
+
+    assert use_cache_flags == [True, False, False]
+
+
+def test_process_video_twice_rebuilds_model_per_event_loop(tmp_path, monkeypatch):
+    summarizer, video_info = make_summarizer(tmp_path, monkeypatch)
+    summarizer.chunks_per_request = 1
+    stub_prepare_chunk(summarizer, monkeypatch)
+
+    # The real async client keeps a grpc channel bound to the loop it first ran on
+    models = []
+
+    class LoopBoundModel:
+        def __init__(self, model_name):
+            self.loop = None
+            models.append(self)
+
+        async def generate_content_async(self, content, generation_config=None):
+            loop = asyncio.get_running_loop()
+            if self.loop is None:
+                self.loop = loop
+            assert self.loop is loop, "model reused across event loops"
+            return types.SimpleNamespace(text="a summary")
+
+    genai = types.ModuleType("google.generativeai")
+    genai.configure = lambda api_key=None: None
+    genai.GenerativeModel = LoopBoundModel
+    google = types.ModuleType("google")
+    google.generativeai = genai
+    monkeypatch.setitem(sys.modules, "google", google)
+    monkeypatch.setitem(sys.modules, "google.generativeai", genai)
+
+    summarizer.process_video("clip.mp4")
+    video_summary, _ = summarizer.process_video("clip.mp4", force_reprocess=True)
+
+    assert len(models) == 2
+    assert [chunk['summary'] for chunk in video_summary['chunks']] == ["a summary"] * 3
+
+
+def test_renamed_copy_gets_its_own_name(tmp_path, monkeypatch):
+    summarizer, video_info = make_summarizer(tmp_path, monkeypatch)
+    chunks = summarizer.segment_video(video_info)
+    summarizer.save_summary_json(summarizer.create_video_summary_json(video_info, [(chunk, "seen") for chunk in chunks]))
+    (tmp_path / "renamed.mp4").write_bytes((tmp_path / "clip.mp4").read_bytes())
+
+    existing_summary, existing_path = summarizer.check_existing_summary("renamed.mp4")
+
+    assert existing_path == "output/renamed_summary.json"
+    assert existing_summary['video_name'] == "renamed.mp4"
+    assert existing_summary['video_path'] == "renamed.mp4"
+    assert [chunk['summary'] for chunk in existing_summary['chunks']] == ["seen"] * 3
+    with open(existing_path, 'r', encoding='utf-8') as f:
+        assert json.load(f)['video_name'] == "renamed.mp4"
+    with open("output/clip_summary.json", 'r', encoding='utf-8') as f:
+        assert json.load(f)['video_name'] == "clip.mp4"
+    assert summarizer.check_existing_summary("clip.mp4")[0]['video_name'] == "clip.mp4"
+
+
+def test_view_summary_finds_output_and_partial_files(tmp_path, monkeypatch, capsys):
+    summarizer, video_info = make_summarizer(tmp_path, monkeypatch)
+    chunks = summarizer.segment_video(video_info)
+    summarizer.save_summary_json(summarizer.create_video_summary_json(video_info, [(chunk, "seen") for chunk in chunks]))
+    with open(summarizer.partial_summary_path("other.mp4"), 'wb') as f:
+        append_jsonl(f, {'type': 'video', 'video_info': dict(video_info, filename="other.mp4"), 'chunk_duration': 30})
+    (tmp_path / "legacy_summary.json").write_text("{}")
+
+    monkeypatch.setattr("builtins.input", lambda prompt: "9")
+    summarizer.view_summary()
+
+    listed = capsys.readouterr().out
+    assert "output/clip_summary.json" in listed
+    assert "output/other_summary.jsonl.part" in listed
+    assert "legacy_summary.json" in listed
+
+
+def test_batch_parses_json_array(tmp_path, monkeypatch):
+    summarizer, batch = make_batch(tmp_path, monkeypatch, json.dumps([
+        {"chunk_number": 3, "summary": " third "},
+        {"chunk_number": 1, "summary": "first"},
+        {"chunk_number": "2", "summary": "second"},
+    ]))
+
+    summaries = asyncio.run(summarizer.summarize_chunk_batch(batch))
+
+    assert summaries == ["first", "second", "third"]
+    assert len(summarizer.model.calls) == 1
+    assert [summarizer.load_cached_chunk_summary(prepared['cache_path']) for prepared in batch] == summaries
+
+
+def test_batch_falls_back_to_single_requests_for_missing_or_malformed_items(tmp_path, monkeypatch):
+    summarizer, batch = make_batch(
+        tmp_path, monkeypatch,
+        json.dumps([{"chunk_number": 1, "summary": "first"}, {"chunk_number": 3}]),
+        "single 2", "single 3",
+    )
+    assert asyncio.run(summarizer.summarize_chunk_batch(batch)) == ["first", "single 2", "single 3"]
+
+    summarizer, batch = make_batch(tmp_path, monkeypatch, "not json", "single 1", "single 2", "single 3")
+    assert asyncio.run(summarizer.summarize_chunk_batch(batch)) == ["single 1", "single 2", "single 3"]
+    # Single-chunk requests use the per-chunk prompt, not the batch one
+    assert all(content[0].startswith("Analyze this") for content, _ in summarizer.model.calls[1:])
+
+
+def test_batch_api_failure_marks_every_chunk_as_error(tmp_path, monkeypatch):
+    summarizer, batch = make_batch(tmp_path, monkeypatch, RuntimeError("500 Internal error"))
+
+    summaries = asyncio.run(summarizer.summarize_chunk_batch(batch))
+
+    assert summaries == ["Error processing chunk: 500 Internal error"] * 3
+    assert len(summarizer.model.calls) == 1
+
+
+def test_batch_max_output_tokens_is_clamped_to_model_limit(tmp_path, monkeypatch):
+    answer = json.dumps([{"chunk_number": n, "summary": f"chunk {n}"} for n in (1, 2, 3)])
+    summarizer, batch = make_batch(tmp_path, monkeypatch, answer, answer)
+
+    asyncio.run(summarizer.summarize_chunk_batch(batch))
+    summarizer.max_output_tokens = 1000
+    asyncio.run(summarizer.summarize_chunk_batch(batch))
+
+    assert [config["max_output_tokens"] for _, config in summarizer.model.calls] == [1500, 1000]
+
+
+def test_failed_batches_release_the_semaphore(tmp_path, monkeypatch):
+    summarizer, video_info = make_summarizer(tmp_path, monkeypatch)
+    stub_prepare_chunk(summarizer, monkeypatch)
+    summarizer.max_concurrent_requests = 1
+    summarizer.chunks_per_request = 2
+    chunks = summarizer.segment_video(dict(video_info, duration=180.0))
+
+    async def flaky_batch(batch, rate_limiter=None):
+        if batch[0]['chunk_info']['chunk_number'] == 1:
+            raise RuntimeError("boom")
+        return [f"chunk {prepared['chunk_info']['chunk_number']}" for prepared in batch]
+
+    monkeypatch.setattr(summarizer, "summarize_chunk_batch", flaky_batch)
+
+    # A semaphore leaked by the failing first batch would block the second one forever
+    chunk_summaries = asyncio.run(asyncio.wait_for(summarizer.summarize_chunks("clip.mp4", chunks), timeout=5))
+
+    assert [summary for _, summary in chunk_summaries] == [
+        "Error processing chunk: no summary returned", "Error processing chunk: no summary returned",
+        "chunk 3", "chunk 4", "chunk 5", "chunk 6",
+    ]
+
+
+def test_rate_limited_request_is_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(video_summarizer, "wait_exponential_jitter", lambda **kwargs: wait_none())
+    answer = json.dumps([{"chunk_number": n, "summary": f"chunk {n}"} for n in (1, 2, 3)])
+    summarizer, batch = make_batch(
+        tmp_path, monkeypatch,
+        RuntimeError("429 Resource has been exhausted"), RuntimeError("429 Resource has been exhausted"), answer,
+    )
+
+    assert asyncio.run(summarizer.summarize_chunk_batch(batch)) == ["chunk 1", "chunk 2", "chunk 3"]
+    assert len(summarizer.model.calls) == 3
+
+    summarizer._model = FakeModel(*[RuntimeError("429 Resource has been exhausted")] * 5)
+    assert asyncio.run(summarizer.summarize_chunk_batch(batch)) == ["Error processing chunk: 429 Resource has been exhausted"] * 3
+    assert len(summarizer.model.calls) == 5
+
+
+def fake_jpeg(payload):
+    return b'\xff\xd8\xff\xe0' + payload + b'\xff\xd9'
+
+
+def test_split_mjpeg_stream():
+    assert split_mjpeg_stream(b'') == []
+
+    one = fake_jpeg(b'one')
+    assert split_mjpeg_stream(one) == [one]
+
+    frames = [fake_jpeg(b'first'), fake_jpeg(b'second'), fake_jpeg(b'third')]
+    assert split_mjpeg_stream(b''.join(frames)) == frames
+
+
+def test_frame_select_filter():
+    summarizer = VideoSummarizer()
+    scale = "scale='if(gt(iw,ih),min(768,iw),-2)':'if(gt(iw,ih),-2,min(768,ih))'"
+
+    chunk_info = {'start_time': 30.0, 'end_time': 60.0, 'duration': 30.0}
+    assert summarizer.frame_select_filter(chunk_info) == (
+        "select='isnan(prev_selected_t)"
+        "+gte(t,15.000)*lt(prev_selected_t,15.000)"
+        "+gte(t,29.900)*lt(prev_selected_t,29.900)',"
+        + scale,
+        3,
+    )
+
+    # Too short for a middle and end frame: only the first frame is selected
+    chunk_info = {'start_time': 60.0, 'end_time': 60.05, 'duration': 0.05}
+    assert summarizer.frame_select_filter(chunk_info) == ("select='isnan(prev_selected_t)'," + scale, 1)